@@ -1,33 +1,248 @@
 import os
+import queue
+import random
+import re
 import sqlite3
 import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import List, Optional
 import json
-import requests
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters, ContextTypes
+from telegram import Update, BotCommand, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
+from telegram.constants import MessageLimit
+from telegram.error import NetworkError
+from telegram.ext import AIORateLimiter, Application, CommandHandler, CallbackQueryHandler, ConversationHandler, Defaults, MessageHandler, filters, ContextTypes
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 
-# Configure logging with DEBUG level
+# Configure logging (INFO by default; set LOG_LEVEL=DEBUG for verbose output)
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.DEBUG)
+    level=os.getenv('LOG_LEVEL', 'INFO').upper())
 logger = logging.getLogger(__name__)
 
+
+class PollingNetworkErrorFilter(logging.Filter):
+    """Drop the tracebacks PTB logs for network errors while polling
+
+    The updater already logs a one-line error for these and retries, so
+    timeouts and dropped connections on a flaky network don't flood the log.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not (record.exc_info
+                    and isinstance(record.exc_info[1], NetworkError))
+
+
+logging.getLogger('telegram.ext.Updater').addFilter(
+    PollingNetworkErrorFilter())
+# httpx logs every Bot API request (a getUpdates call per long poll) at INFO
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
 # Constants
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 DATABASE_FILE = 'girltalk_bot.db'
+SCHEMA_VERSION = 2  # Stored in PRAGMA user_version; bump with each migration
+READ_POOL_SIZE = 4  # Number of read-only connections kept open
+STATEMENT_CACHE_SIZE = 256  # Prepared statements cached per connection
+DB_MAX_WORKERS = READ_POOL_SIZE + 1  # One thread per SQLite connection
+CALENDAR_MAX_WORKERS = 16  # Threads for Google Calendar requests
+# In-request retries stay short; longer backoff is left to the outbox
+CALENDAR_RETRY_ATTEMPTS = 3  # Tries per Calendar delete before queueing it
+CALENDAR_RETRY_MAX_DELAY = 5  # Upper bound in seconds for one backoff
+CALENDAR_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Transient API errors
+RECONCILE_INTERVAL = 60  # Seconds between pending Calendar operation sweeps
+RECONCILE_BATCH_SIZE = 20  # Pending Calendar operations retried per sweep
+RECONCILE_MAX_DELAY = 3600  # Upper bound in seconds between retries of one op
+RECONCILE_MAX_ATTEMPTS = 48  # Failed retries before a queued op is abandoned
 GOOGLE_CALENDAR_ON = True
 # Get calendar ID from Replit Secrets
 CALENDAR_ID = os.getenv('GOOGLE_CALENDAR_ID',
                         'primary')  # Use shared calendar ID from Secrets
+# Public HTTPS base URL for Telegram webhooks; long polling is used when unset
+WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+WEBHOOK_PORT = int(os.getenv('PORT', '8443'))
+WEBHOOK_MAX_CONNECTIONS = 100  # Telegram's cap on parallel webhook deliveries
+# Only the update types the bot handles are delivered by Telegram
+ALLOWED_UPDATES = ['message', 'callback_query']
+POLL_TIMEOUT = 25  # Seconds each getUpdates long poll waits for updates
+CONNECTION_POOL_SIZE = 256  # HTTP connections for outgoing Bot API calls
+RATE_LIMIT_PER_SECOND = 25  # Outgoing Bot API calls, under Telegram's 30/s
+RATE_LIMIT_RETRIES = 3  # Retries for calls Telegram still answers with 429
+HANDLER_DEFAULTS = Defaults(block=False)  # Applied to all handlers by PTB
 # GOOGLE_CALENDAR_ON = os.getenv('GOOGLE_CALENDAR_ON', 'false').lower() == 'true'  # Feature toggle for Google Calendar
 
+# Main menu keyboard labels
+CREATE_MEETING_BUTTON = "📅 Create Meeting"
+UPCOMING_MEETINGS_BUTTON = "📋 Upcoming Meetings"
+MY_MEETINGS_BUTTON = "📊 My Meetings"
+HELP_BUTTON = "❓ Help"
+
+# Reply-keyboard buttons mapped to the GirlTalkBot method they trigger;
+# Create Meeting is the entry point of the creation conversation instead
+KEYBOARD_COMMANDS = {
+    UPCOMING_MEETINGS_BUTTON: 'upcoming_meetings_command',
+    MY_MEETINGS_BUTTON: 'my_meetings_command',
+    HELP_BUTTON: 'help_command',
+}
+KEYBOARD_PATTERN = re.compile(
+    f"^({'|'.join(map(re.escape, KEYBOARD_COMMANDS))})$")
+CREATE_MEETING_PATTERN = re.compile(f"^{re.escape(CREATE_MEETING_BUTTON)}$")
+
+# Bot commands as (command, menu description, GirlTalkBot method); both the
+# handlers and the menu published to Telegram at startup are built from it
+BOT_COMMANDS = (
+    ("create_meeting", "Create a new meeting", 'create_meeting_command'),
+    ("upcoming_meetings", "View all upcoming meetings",
+     'upcoming_meetings_command'),
+    ("my_meetings", "View meetings you created", 'my_meetings_command'),
+    ("help", "Show the help message", 'help_command'),
+    ("start", "Show the welcome message and menu", 'start_command'),
+)
+
+# Static replies and markups, built once at import time
+WELCOME_TEXT = ("🌸 Welcome to GirlTalkBot! 🌸\n\n"
+                "I help the Girl Talk Community manage meetings and events.\n\n"
+                "Available commands:\n"
+                "📅 /create_meeting - Create a new meeting\n"
+                "📋 /upcoming_meetings - View all upcoming meetings\n"
+                "📊 /my_meetings - View meetings you created\n"
+                "❓ /help - Show this help message\n\n"
+                "Let's make organizing events easier! ✨")
+
+HELP_TEXT = ("🌸 GirlTalkBot Help 🌸\n\n"
+             "Commands:\n"
+             "📅 /create_meeting - Create a new meeting\n"
+             "📋 /upcoming_meetings - View all upcoming meetings\n"
+             "📊 /my_meetings - View meetings you created\n"
+             "🗑️ /delete_meeting <meeting_id> - Delete your meeting\n\n"
+             "How to use:\n"
+             "1. Create meetings with title, description, and date/time\n"
+             "2. Other members can register for meetings\n"
+             "3. View statistics and manage your meetings\n\n"
+             "Need help? Contact the community admins! 💝")
+
+MAIN_MENU = ReplyKeyboardMarkup(
+    [[KeyboardButton(CREATE_MEETING_BUTTON),
+      KeyboardButton(UPCOMING_MEETINGS_BUTTON)],
+     [KeyboardButton(MY_MEETINGS_BUTTON),
+      KeyboardButton(HELP_BUTTON)]],
+    resize_keyboard=True)
+
+# Meeting creation conversation states
+MEETING_TITLE, MEETING_DESCRIPTION, MEETING_DATETIME = range(3)
+
+# Inline button text templates
+REGISTER_BUTTON_TEXT = "✅ Register #{meeting_id} ({count} registered)"
+REGISTERED_BUTTON_TEXT = "✅ Registered #{meeting_id} ({count} registered)"
+STATS_BUTTON_TEXT = "📊 Stats #{meeting_id}"
+
+
+# SQL statements, kept as constants so every pooled connection reuses the
+# compiled statement from its cache instead of re-parsing the SQL
+SQL_UPCOMING_MEETINGS = '''
+    SELECT m.id, m.creator_username, m.title, m.description,
+           m.start_ts, m.calendar_link,
+           COUNT(r.user_id) AS registration_count
+    FROM meetings m
+    LEFT JOIN registrations r ON r.meeting_id = m.id
+    WHERE m.start_ts > ?
+    GROUP BY m.id
+    ORDER BY m.start_ts ASC
+'''
+
+SQL_USER_MEETINGS = '''
+    SELECT m.id, m.title, m.description, m.start_ts,
+           m.calendar_link, COUNT(r.user_id) AS registration_count
+    FROM meetings m
+    LEFT JOIN registrations r ON r.meeting_id = m.id
+    WHERE m.creator_id = ?
+    GROUP BY m.id
+    ORDER BY m.start_ts ASC
+'''
+
+SQL_MEETING_BY_ID = '''
+    SELECT id, event_id, creator_id, creator_username, title,
+           description, start_ts, calendar_link
+    FROM meetings WHERE id = ?
+'''
+
+SQL_REGISTRATION_COUNT = 'SELECT COUNT(*) FROM registrations WHERE meeting_id = ?'
+
+SQL_MEETING_REGISTRATIONS = '''
+    SELECT username, registered_ts FROM registrations
+    WHERE meeting_id = ?
+    ORDER BY registered_ts ASC
+'''
+
+SQL_INSERT_MEETING = '''
+    INSERT INTO meetings (event_id, creator_id, creator_username, title, description, start_time, end_time, calendar_link, start_ts, end_ts)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERT_REGISTRATION = '''
+    INSERT OR IGNORE INTO registrations (meeting_id, user_id, username, registered_ts)
+    VALUES (?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+'''
+
+SQL_DELETE_MEETING_REGISTRATIONS = 'DELETE FROM registrations WHERE meeting_id = ?'
+
+SQL_DELETE_MEETING = 'DELETE FROM meetings WHERE id = ?'
+
+SQL_INSERT_PENDING_CALENDAR_DELETE = '''
+    INSERT OR IGNORE INTO pending_calendar_ops (event_id, op, next_try_ts)
+    VALUES (?, 'delete', ?)
+'''
+
+SQL_DUE_CALENDAR_DELETES = '''
+    SELECT id, event_id, attempts FROM pending_calendar_ops
+    WHERE op = 'delete' AND next_try_ts <= ?
+    ORDER BY next_try_ts
+    LIMIT ?
+'''
+
+SQL_RESCHEDULE_CALENDAR_OP = '''
+    UPDATE pending_calendar_ops SET attempts = ?, next_try_ts = ? WHERE id = ?
+'''
+
+SQL_DELETE_CALENDAR_OP = 'DELETE FROM pending_calendar_ops WHERE id = ?'
+
+
+def utf16_length(text: str) -> int:
+    """Length of text as Telegram counts it (UTF-16 code units)"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def retry_delay(retry_after: Optional[str], attempt: int,
+                max_delay: float = CALENDAR_RETRY_MAX_DELAY) -> float:
+    """Seconds to wait before the next retry, honouring Retry-After"""
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        # Exponential backoff with jitter when the server gives no hint; the
+        # exponent is clamped so large attempt counts can't overflow a float
+        delay = 2**min(attempt, 16) + random.random()
+    return min(max_delay, delay)
+
+
+def split_sql_script(script: str) -> List[str]:
+    """Split a SQL script into statements that can be run one at a time"""
+    statements, buffer = [], ''
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ''
+    return statements
+
 
 class GirlTalkBot:
     """
@@ -37,12 +252,104 @@ class GirlTalkBot:
     def __init__(self):
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.calendar_service = None
+        self._calendar_events = None
+        self._calendar_credentials = None
+        self._calendar_http = threading.local()
+        self._db_executor = None
+        self._calendar_executor = None
+        self._write_queue = None
+        self._writer_task = None
+        self._reconciler_task = None
+
+        # One long-lived writer plus a small pool of read-only connections,
+        # opened once instead of on every query
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
         self.init_database()
+        self._read_pool = queue.Queue()
+        for _ in range(READ_POOL_SIZE):
+            self._read_pool.put(self._connect(read_only=True))
+
         self.setup_google_calendar()
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a long-lived SQLite connection configured for WAL mode"""
+        if read_only:
+            conn = sqlite3.connect(f'file:{DATABASE_FILE}?mode=ro',
+                                   uri=True,
+                                   check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+        else:
+            conn = sqlite3.connect(DATABASE_FILE,
+                                   check_same_thread=False,
+                                   isolation_level=None,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-8000')
+        return conn
+
+    @contextmanager
+    def _read(self):
+        """Borrow a read-only connection from the pool and yield a cursor"""
+        conn = self._read_pool.get()
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self._read_pool.put(conn)
+
+    @contextmanager
+    def _write(self):
+        """Yield a cursor on the shared write connection (autocommit mode)"""
+        with self._write_lock:
+            cursor = self._write_conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
+    async def run_db(self, func, *args):
+        """Run a blocking database method on the SQLite executor"""
+        # The pool has one thread per connection, so queued work waits on
+        # the executor instead of tying up threads blocked on the pool
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_executor, func, *args)
+
+    def close(self):
+        """Optimize and checkpoint the database, then close all connections
+
+        Call once the SQLite executor has been shut down (post_stop), so no
+        query is still using a connection.
+        """
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+        # The connection is closed under the write lock, so no write can
+        # slip in between the checkpoint and the close
+        with self._write_lock:
+            try:
+                cursor = self._write_conn.cursor()
+                # Refresh planner statistics for the next run and fold the
+                # WAL back into the database file so it doesn't keep growing
+                cursor.execute('PRAGMA optimize')
+                cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                cursor.close()
+            except sqlite3.Error as e:
+                logger.error("Error finalizing database: %s", e)
+            finally:
+                self._write_conn.close()
+        logger.debug("Database connections closed")
+
     def init_database(self):
         """Initialize SQLite database from schema file"""
-        logger.debug(f"Initializing database: {DATABASE_FILE}")
+        logger.debug("Initializing database: %s", DATABASE_FILE)
 
         # Check if schema.sql exists
         if not os.path.exists('schema.sql'):
@@ -50,36 +357,85 @@ class GirlTalkBot:
             raise FileNotFoundError(
                 "schema.sql is required for database initialization")
 
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-
         # Read and execute schema from file
         logger.debug("Loading database schema from schema.sql")
         with open('schema.sql', 'r') as schema_file:
             schema_sql = schema_file.read()
 
-        # Execute schema statements
-        cursor.executescript(schema_sql)
-
-        # Add calendar_link column if it doesn't exist (for existing databases migration)
-        try:
-            cursor.execute(
-                'ALTER TABLE meetings ADD COLUMN calendar_link TEXT')
-            logger.debug(
-                "Added calendar_link column to existing meetings table")
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
+        with self._write() as cursor:
+            # Bootstrap in a single transaction (one durable write on the
+            # WAL connection). Statements are run one by one because
+            # executescript() would commit the open transaction first.
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                # Migrations run only when the database predates
+                # SCHEMA_VERSION, instead of attempting ALTER TABLE on
+                # every startup
+                cursor.execute('PRAGMA user_version')
+                version = cursor.fetchone()[0]
+                if version < SCHEMA_VERSION:
+                    cursor.execute("SELECT 1 FROM sqlite_master "
+                                   "WHERE type = 'table' AND name = 'meetings'")
+                    if cursor.fetchone():
+                        self.migrate_database(cursor, version)
+
+                # Execute schema statements
+                for statement in split_sql_script(schema_sql):
+                    cursor.execute(statement)
+
+                if version < SCHEMA_VERSION:
+                    cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+
+        if version < SCHEMA_VERSION:
+            logger.debug("Database schema upgraded from version %s to %s",
+                         version, SCHEMA_VERSION)
 
-        conn.commit()
-        conn.close()
         logger.info("Database initialized successfully from schema.sql")
 
+    def migrate_database(self, cursor: sqlite3.Cursor, version: int):
+        """Bring tables created by an older schema.sql up to date"""
+        if version < 1:
+            # Columns added after the tables were first created
+            for table, column, column_type in (
+                ('meetings', 'calendar_link', 'TEXT'),
+                ('meetings', 'start_ts', 'INTEGER'),
+                ('meetings', 'end_ts', 'INTEGER'),
+                ('registrations', 'registered_ts', 'INTEGER'),
+            ):
+                cursor.execute(f'PRAGMA table_info({table})')
+                if column not in {row['name'] for row in cursor.fetchall()}:
+                    cursor.execute(
+                        f'ALTER TABLE {table} ADD COLUMN {column} {column_type}'
+                    )
+                    logger.debug("Added %s column to %s table", column, table)
+
+            # Backfill epoch columns from the ISO strings. Meeting times are
+            # stored as local time, registered_at is SQLite's UTC timestamp.
+            cursor.execute('''
+                UPDATE meetings
+                SET start_ts = CAST(strftime('%s', start_time, 'utc') AS INTEGER),
+                    end_ts = CAST(strftime('%s', end_time, 'utc') AS INTEGER)
+                WHERE start_ts IS NULL
+            ''')
+            cursor.execute('''
+                UPDATE registrations
+                SET registered_ts = CAST(strftime('%s', registered_at) AS INTEGER)
+                WHERE registered_ts IS NULL
+            ''')
+
+        if version < 2:
+            # Queries filter and sort on start_ts; the old index on the ISO
+            # string is never used but still maintained on every insert
+            cursor.execute('DROP INDEX IF EXISTS idx_meetings_start_time')
+
     def setup_google_calendar(self):
         """Setup Google Calendar API service using service account"""
-        logger.debug(
-            f"Setting up Google Calendar (GOOGLE_CALENDAR_ON={GOOGLE_CALENDAR_ON})"
-        )
+        logger.debug("Setting up Google Calendar (GOOGLE_CALENDAR_ON=%s)",
+                     GOOGLE_CALENDAR_ON)
         if not GOOGLE_CALENDAR_ON:
             self.calendar_service = None
             logger.info("Google Calendar integration DISABLED")
@@ -99,13 +455,23 @@ class GirlTalkBot:
                 'service-account-key.json', scopes=SCOPES)
 
             logger.debug("Building Calendar service")
-            self.calendar_service = build('calendar', 'v3', credentials=creds)
+            # Use the discovery document bundled with google-api-python-client
+            # so startup never fetches it from googleapis.com
+            self.calendar_service = build('calendar',
+                                          'v3',
+                                          credentials=creds,
+                                          static_discovery=True,
+                                          cache_discovery=False)
+            # events() builds a new Resource from the discovery document on
+            # every call, so the one used for all requests is kept here
+            self._calendar_events = self.calendar_service.events()
+            self._calendar_credentials = creds
             logger.info(
                 "Google Calendar service initialized successfully with service account"
             )
 
         except Exception as e:
-            logger.error(f"Error setting up Google Calendar: {e}")
+            logger.error("Error setting up Google Calendar: %s", e)
             self.calendar_service = None
 
     async def start_command(self, update: Update,
@@ -113,174 +479,139 @@ class GirlTalkBot:
         """Handle /start command"""
         user_id = update.effective_user.id
         username = update.effective_user.username or "Unknown"
-        logger.info(f"User {user_id} (@{username}) started the bot")
-        logger.debug(f"Processing /start command for user {user_id}")
-
-        welcome_message = (
-            "🌸 Welcome to GirlTalkBot! 🌸\n\n"
-            "I help the Girl Talk Community manage meetings and events.\n\n"
-            "Available commands:\n"
-            "📅 /create_meeting - Create a new meeting\n"
-            "📋 /upcoming_meetings - View all upcoming meetings\n"
-            "📊 /my_meetings - View meetings you created\n"
-            "❓ /help - Show this help message\n\n"
-            "Let's make organizing events easier! ✨")
-
-        # Create main menu keyboard
-        keyboard = [[
-            KeyboardButton("📅 Create Meeting"),
-            KeyboardButton("📋 Upcoming Meetings")
-        ], [KeyboardButton("📊 My Meetings"),
-            KeyboardButton("❓ Help")]]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-
-        await update.message.reply_text(welcome_message,
-                                        reply_markup=reply_markup)
-        logger.debug(f"Sent welcome message to user {user_id}")
+        logger.info("User %s (@%s) started the bot", user_id, username)
+        logger.debug("Processing /start command for user %s", user_id)
+
+        await update.message.reply_text(WELCOME_TEXT, reply_markup=MAIN_MENU)
+        logger.debug("Sent welcome message to user %s", user_id)
 
     async def help_command(self, update: Update,
                            context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command"""
-        help_text = (
-            "🌸 GirlTalkBot Help 🌸\n\n"
-            "Commands:\n"
-            "📅 /create_meeting - Create a new meeting\n"
-            "📋 /upcoming_meetings - View all upcoming meetings\n"
-            "📊 /my_meetings - View meetings you created\n"
-            "🗑️ /delete_meeting <meeting_id> - Delete your meeting\n\n"
-            "How to use:\n"
-            "1. Create meetings with title, description, and date/time\n"
-            "2. Other members can register for meetings\n"
-            "3. View statistics and manage your meetings\n\n"
-            "Need help? Contact the community admins! 💝")
-        await update.message.reply_text(help_text)
+        await update.message.reply_text(HELP_TEXT)
 
     async def create_meeting_command(self, update: Update,
                                      context: ContextTypes.DEFAULT_TYPE):
-        """Start the meeting creation process"""
+        """Start the meeting creation conversation"""
         user_id = update.effective_user.id
         username = update.effective_user.username or "Unknown"
-        logger.info(f"User {user_id} (@{username}) started creating a meeting")
-        logger.debug(f"Initiating meeting creation flow for user {user_id}")
+        logger.info("User %s (@%s) started creating a meeting",
+                    user_id, username)
+        logger.debug("Initiating meeting creation flow for user %s", user_id)
 
         await update.message.reply_text("📅 Let's create a new meeting!\n\n"
                                         "Please send me the meeting title:")
-        context.user_data['creating_meeting'] = True
-        context.user_data['meeting_step'] = 'title'
-        logger.debug(
-            f"Set meeting creation state for user {user_id}: step=title")
+        # All flow data lives in one dict, so a single pop clears it
+        context.user_data['create_flow'] = {}
+        return MEETING_TITLE
 
-    async def handle_meeting_creation(self, update: Update,
-                                      context: ContextTypes.DEFAULT_TYPE):
-        """Handle meeting creation flow"""
+    async def receive_meeting_title(self, update: Update,
+                                    context: ContextTypes.DEFAULT_TYPE):
+        """Store the meeting title and ask for a description"""
         user_id = update.effective_user.id
-        logger.debug(f"Processing meeting creation input from user {user_id}")
-
-        if not context.user_data.get('creating_meeting'):
-            logger.debug(
-                f"User {user_id} not in meeting creation flow, ignoring")
-            return
-
-        step = context.user_data.get('meeting_step')
-        logger.debug(f"User {user_id} in meeting creation step: {step}")
-
-        if step == 'title':
-            title = update.message.text
-            logger.debug(f"User {user_id} provided meeting title: {title}")
-            context.user_data['meeting_title'] = title
-            context.user_data['meeting_step'] = 'description'
-            await update.message.reply_text(
-                f"✅ Title: {title}\n\n"
-                "Now, please provide a description for the meeting:")
-            logger.debug(f"Advanced user {user_id} to description step")
-
-        elif step == 'description':
-            description = update.message.text
+        title = update.message.text
+        logger.debug("User %s provided meeting title: %s", user_id, title)
+        context.user_data['create_flow']['title'] = title
+        await update.message.reply_text(
+            f"✅ Title: {title}\n\n"
+            "Now, please provide a description for the meeting:")
+        logger.debug("Advanced user %s to description step", user_id)
+        return MEETING_DESCRIPTION
+
+    async def receive_meeting_description(self, update: Update,
+                                          context: ContextTypes.DEFAULT_TYPE):
+        """Store the meeting description and ask for the date and time"""
+        user_id = update.effective_user.id
+        description = update.message.text
+        logger.debug("User %s provided meeting description: %s",
+                     user_id, description)
+        context.user_data['create_flow']['description'] = description
+        await update.message.reply_text(
+            f"✅ Description: {description}\n\n"
+            "Please provide the date and time for the meeting.\n"
+            "Format: YYYY-MM-DD HH:MM\n"
+            "Example: 2024-12-25 14:30")
+        logger.debug("Advanced user %s to datetime step", user_id)
+        return MEETING_DATETIME
+
+    async def receive_meeting_datetime(self, update: Update,
+                                       context: ContextTypes.DEFAULT_TYPE):
+        """Parse the meeting date and time and create the meeting"""
+        user_id = update.effective_user.id
+        datetime_input = update.message.text
+        logger.debug("User %s provided meeting datetime: %s",
+                     user_id, datetime_input)
+        try:
+            # Parse the datetime
+            meeting_datetime = datetime.strptime(datetime_input,
+                                                 "%Y-%m-%d %H:%M")
+        except ValueError as e:
             logger.debug(
-                f"User {user_id} provided meeting description: {description}")
-            context.user_data['meeting_description'] = description
-            context.user_data['meeting_step'] = 'datetime'
+                "User %s provided invalid datetime format: %s, error: %s",
+                user_id, datetime_input, e)
             await update.message.reply_text(
-                f"✅ Description: {description}\n\n"
-                "Please provide the date and time for the meeting.\n"
-                "Format: YYYY-MM-DD HH:MM\n"
+                "❌ Invalid date format. Please use: YYYY-MM-DD HH:MM\n"
                 "Example: 2024-12-25 14:30")
-            logger.debug(f"Advanced user {user_id} to datetime step")
-
-        elif step == 'datetime':
-            datetime_input = update.message.text
-            logger.debug(
-                f"User {user_id} provided meeting datetime: {datetime_input}")
-            try:
-                # Parse the datetime
-                meeting_datetime = datetime.strptime(datetime_input,
-                                                     "%Y-%m-%d %H:%M")
-                logger.debug(
-                    f"Parsed datetime for user {user_id}: {meeting_datetime}")
-
-                # Check if the date is in the future
-                if meeting_datetime <= datetime.now():
-                    logger.debug(
-                        f"User {user_id} provided past datetime, rejecting")
-                    await update.message.reply_text(
-                        "❌ Please provide a future date and time.\n"
-                        "Format: YYYY-MM-DD HH:MM")
-                    return
-
-                # Create the meeting
-                logger.info(
-                    f"Creating meeting for user {user_id}: {context.user_data['meeting_title']}"
-                )
-                success, calendar_link = await self.create_calendar_event(
-                    title=context.user_data['meeting_title'],
-                    description=context.user_data['meeting_description'],
-                    start_time=meeting_datetime,
-                    creator_id=update.effective_user.id,
-                    creator_username=update.effective_user.username
-                    or "Unknown")
+            return MEETING_DATETIME
 
-                if success:
-                    logger.info(
-                        f"Meeting created successfully for user {user_id}")
+        logger.debug("Parsed datetime for user %s: %s",
+                     user_id, meeting_datetime)
 
-                    success_message = (
-                        f"🎉 Meeting created successfully!\n\n"
-                        f"📅 **{context.user_data['meeting_title']}**\n"
-                        f"📝 {context.user_data['meeting_description']}\n"
-                        f"🕐 {meeting_datetime.strftime('%Y-%m-%d at %H:%M')}\n\n"
-                    )
-
-                    if calendar_link:
-                        success_message += f"📞 [Join Google Calendar Meeting]({calendar_link})\n\n"
-
-                    success_message += "Your meeting has been added and members can now register! ✨"
+        # Check if the date is in the future
+        if meeting_datetime <= datetime.now():
+            logger.debug("User %s provided past datetime, rejecting",
+                         user_id)
+            await update.message.reply_text(
+                "❌ Please provide a future date and time.\n"
+                "Format: YYYY-MM-DD HH:MM")
+            return MEETING_DATETIME
+
+        # Create the meeting
+        flow = context.user_data['create_flow']
+        logger.info("Creating meeting for user %s: %s", user_id, flow['title'])
+        success, calendar_link = await self.create_calendar_event(
+            title=flow['title'],
+            description=flow['description'],
+            start_time=meeting_datetime,
+            creator_id=update.effective_user.id,
+            creator_username=update.effective_user.username or "Unknown")
+
+        if success:
+            logger.info("Meeting created successfully for user %s", user_id)
+
+            success_message = (
+                f"🎉 Meeting created successfully!\n\n"
+                f"📅 **{flow['title']}**\n"
+                f"📝 {flow['description']}\n"
+                f"🕐 {meeting_datetime.strftime('%Y-%m-%d at %H:%M')}\n\n")
+
+            if calendar_link:
+                success_message += f"📞 [Join Google Calendar Meeting]({calendar_link})\n\n"
+
+            success_message += "Your meeting has been added and members can now register! ✨"
+
+            await update.message.reply_text(success_message,
+                                            parse_mode='Markdown',
+                                            disable_web_page_preview=True)
+        else:
+            logger.error("Failed to create meeting for user %s", user_id)
+            await update.message.reply_text(
+                "❌ Sorry, there was an error creating the meeting. Please try again."
+            )
 
-                    await update.message.reply_text(
-                        success_message,
-                        parse_mode='Markdown',
-                        disable_web_page_preview=True)
-                else:
-                    logger.error(
-                        f"Failed to create meeting for user {user_id}")
-                    await update.message.reply_text(
-                        "❌ Sorry, there was an error creating the meeting. Please try again."
-                    )
+        # Reset creation state
+        logger.debug("Resetting meeting creation state for user %s", user_id)
+        context.user_data.pop('create_flow', None)
+        return ConversationHandler.END
 
-                # Reset creation state
-                logger.debug(
-                    f"Resetting meeting creation state for user {user_id}")
-                context.user_data['creating_meeting'] = False
-                context.user_data.pop('meeting_step', None)
-                context.user_data.pop('meeting_title', None)
-                context.user_data.pop('meeting_description', None)
-
-            except ValueError as e:
-                logger.debug(
-                    f"User {user_id} provided invalid datetime format: {datetime_input}, error: {e}"
-                )
-                await update.message.reply_text(
-                    "❌ Invalid date format. Please use: YYYY-MM-DD HH:MM\n"
-                    "Example: 2024-12-25 14:30")
+    async def meeting_creation_in_progress(self, update: Update,
+                                           context: ContextTypes.DEFAULT_TYPE):
+        """Answer messages sent while a creation step is still being handled"""
+        logger.debug("User %s sent a message while a creation step was running",
+                     update.effective_user.id)
+        await update.message.reply_text(
+            "⏳ Still working on your previous message. "
+            "Please wait a moment and send this again.")
 
     async def create_calendar_event(self, title: str, description: str,
                                     start_time: datetime, creator_id: int,
@@ -298,8 +629,7 @@ class GirlTalkBot:
                 try:
                     event = {
                         'summary': title,
-                        'description':
-                        f"{description}\n\nCreated by: @{creator_username}",
+                        'description': description,
                         'start': {
                             'dateTime': start_time.isoformat(),
                             'timeZone': 'UTC',
@@ -308,21 +638,30 @@ class GirlTalkBot:
                             'dateTime': end_time.isoformat(),
                             'timeZone': 'UTC',
                         },
+                        # Creator metadata lives outside the description so
+                        # events can be filtered with privateExtendedProperty
+                        'extendedProperties': {
+                            'private': {
+                                'creator_id': str(creator_id),
+                                'creator_username': creator_username,
+                            },
+                        },
                     }
 
-                    created_event = self.calendar_service.events().insert(
-                        calendarId=CALENDAR_ID, body=event).execute()
+                    created_event = await self.run_calendar_request(
+                        self._calendar_events.insert(
+                            calendarId=CALENDAR_ID, body=event))
 
                     event_id = created_event['id']
                     calendar_link = created_event.get('htmlLink')
-                    logger.info(f"Google Calendar event created: {event_id}")
-                    logger.debug(f"Google Calendar link: {calendar_link}")
+                    logger.info("Google Calendar event created: %s", event_id)
+                    logger.debug("Google Calendar link: %s", calendar_link)
 
                 except HttpError as e:
-                    logger.error(f"Google Calendar API error: {e}")
+                    logger.error("Google Calendar API error: %s", e)
                     # Continue with database-only storage
                 except Exception as e:
-                    logger.error(f"Error creating Google Calendar event: {e}")
+                    logger.error("Error creating Google Calendar event: %s", e)
                     # Continue with database-only storage
 
             # Generate fallback event ID if Google Calendar failed or is disabled
@@ -330,98 +669,126 @@ class GirlTalkBot:
                 event_id = f"local_event_{datetime.now().timestamp()}"
                 if not GOOGLE_CALENDAR_ON:
                     logger.info(
-                        f"Meeting created (Google Calendar disabled): {title}")
+                        "Meeting created (Google Calendar disabled): %s",
+                        title)
                 else:
                     logger.info(
-                        f"Meeting created (Google Calendar failed, using local storage): {title}"
-                    )
+                        "Meeting created (Google Calendar failed, using local storage): %s",
+                        title)
 
             # Store in database (including calendar link)
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                '''
-                INSERT INTO meetings (event_id, creator_id, creator_username, title, description, start_time, end_time, calendar_link)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (event_id, creator_id, creator_username, title, description,
-                  start_time.isoformat(), end_time.isoformat(), calendar_link))
-
-            conn.commit()
-            conn.close()
+            await self.run_db(self.save_meeting, event_id, creator_id,
+                              creator_username, title, description,
+                              start_time, end_time, calendar_link)
 
             return True, calendar_link
 
         except Exception as e:
-            logger.error(f"Error creating meeting: {e}")
+            logger.error("Error creating meeting: %s", e)
             return False, None
 
+    async def run_calendar_request(self, request):
+        """Execute a Google Calendar API request on the calendar executor"""
+        # Calendar round-trips get their own threads so slow Google
+        # responses never hold up the SQLite work on the database executor
+        return await asyncio.get_running_loop().run_in_executor(
+            self._calendar_executor, self.execute_calendar_request, request)
+
+    def execute_calendar_request(self, request):
+        """Execute a Google Calendar API request (blocking, runs in a thread)"""
+        # httplib2 is not thread-safe, so every worker thread keeps its own
+        # authorized connection and calendar calls can run concurrently.
+        # build_http() applies googleapiclient's 60 s socket timeout, so a
+        # stalled connection can't hold a calendar thread forever.
+        http = getattr(self._calendar_http, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self._calendar_credentials,
+                                  http=build_http())
+            self._calendar_http.http = http
+        return request.execute(http=http)
+
     async def upcoming_meetings_command(self, update: Update,
                                         context: ContextTypes.DEFAULT_TYPE):
         """Show all upcoming meetings"""
         user_id = update.effective_user.id
         username = update.effective_user.username or "Unknown"
-        logger.info(
-            f"User {user_id} (@{username}) requested upcoming meetings")
+        logger.info("User %s (@%s) requested upcoming meetings",
+                    user_id, username)
 
-        meetings = self.get_upcoming_meetings()
-        logger.debug(f"Found {len(meetings)} upcoming meetings")
+        meetings = await self.run_db(self.get_upcoming_meetings)
+        logger.debug("Found %s upcoming meetings", len(meetings))
 
         if not meetings:
-            logger.debug(f"No upcoming meetings found for user {user_id}")
+            logger.debug("No upcoming meetings found for user %s", user_id)
             await update.message.reply_text(
                 "📅 No upcoming meetings scheduled.\n\n"
                 "Be the first to create one! Use /create_meeting 🌸")
             return
 
-        message = "📅 **Upcoming Meetings** 📅\n\n"
+        # Collate all meetings into as few messages as Telegram allows,
+        # with one keyboard row per meeting
+        messages = []
+        text_parts = ["📅 **Upcoming Meetings** 📅\n\n"]
+        text_length = utf16_length(text_parts[0])
+        rows = []
 
         for i, meeting in enumerate(meetings):
-            # meeting columns: id, event_id, creator_id, creator_username, title, description, start_time, end_time, created_at
-            meeting_id = meeting[0]
-            logger.debug(
-                f"Processing meeting {i+1}/{len(meetings)}: ID={meeting_id}, title={meeting[4]}"
-            )
-
-            registration_count = self.get_registration_count(meeting_id)
-            start_time = datetime.fromisoformat(
-                meeting[6])  # start_time is at index 6
-
-            # Create registration button
-            keyboard = [[
+            meeting_id = meeting['id']
+            logger.debug("Processing meeting %s/%s: ID=%s, title=%s",
+                         i + 1, len(meetings), meeting_id, meeting['title'])
+
+            registration_count = meeting['registration_count']
+            start_time = datetime.fromtimestamp(meeting['start_ts'])
+
+            # Create registration button row
+            row = [
+                InlineKeyboardButton(REGISTER_BUTTON_TEXT.format(
+                    meeting_id=meeting_id, count=registration_count),
+                                     callback_data=f"register_{meeting_id}"),
                 InlineKeyboardButton(
-                    f"✅ Register ({registration_count} registered)",
-                    callback_data=f"register_{meeting_id}"),
-                InlineKeyboardButton("📊 Stats",
-                                     callback_data=f"stats_{meeting_id}")
-            ]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+                    STATS_BUTTON_TEXT.format(meeting_id=meeting_id),
+                    callback_data=f"stats_{meeting_id}")
+            ]
 
             meeting_text = (
-                f"🌸 **{meeting[4]}**\n"  # title is at index 4
-                f"📝 {meeting[5]}\n"  # description is at index 5
+                f"🌸 **{meeting['title']}**\n"
+                f"📝 {meeting['description']}\n"
                 f"🕐 {start_time.strftime('%Y-%m-%d at %H:%M')}\n"
-                f"👩‍💼 Created by: @{meeting[3]}\n"  # creator_username is at index 3
+                f"👩‍💼 Created by: @{meeting['creator_username']}\n"
                 f"👥 Registered: {registration_count} members\n")
 
-            # Add calendar link if available (calendar_link is at index 8)
-            if len(meeting) > 8 and meeting[8]:
-                meeting_text += f"📞 [Join Meeting]({meeting[8]})\n"
+            # Add calendar link if available
+            if meeting['calendar_link']:
+                meeting_text += f"📞 [Join Meeting]({meeting['calendar_link']})\n"
 
-            meeting_text += f"🆔 Meeting ID: {meeting_id}"
+            meeting_text += f"🆔 Meeting ID: {meeting_id}\n\n"
 
-            await update.message.reply_text(meeting_text,
-                                            reply_markup=reply_markup,
-                                            parse_mode='Markdown',
-                                            disable_web_page_preview=True)
-            logger.debug(
-                f"Sent meeting {meeting_id} details to user {user_id}")
+            # Start a new message when this one would exceed Telegram's limit
+            meeting_length = utf16_length(meeting_text)
+            if rows and text_length + meeting_length > MessageLimit.MAX_TEXT_LENGTH:
+                messages.append(("".join(text_parts), rows))
+                text_parts, text_length, rows = [], 0, []
+
+            text_parts.append(meeting_text)
+            text_length += meeting_length
+            rows.append(row)
+
+        messages.append(("".join(text_parts), rows))
+
+        for text, rows in messages:
+            await update.message.reply_text(
+                text,
+                reply_markup=InlineKeyboardMarkup(rows),
+                parse_mode='Markdown',
+                disable_web_page_preview=True)
+        logger.debug("Sent %s meetings in %s messages to user %s",
+                     len(meetings), len(messages), user_id)
 
     async def my_meetings_command(self, update: Update,
                                   context: ContextTypes.DEFAULT_TYPE):
         """Show meetings created by the user"""
         user_id = update.effective_user.id
-        meetings = self.get_user_meetings(user_id)
+        meetings = await self.run_db(self.get_user_meetings, user_id)
 
         if not meetings:
             await update.message.reply_text(
@@ -432,30 +799,29 @@ class GirlTalkBot:
         message = "📊 **Your Meetings** 📊\n\n"
 
         for meeting in meetings:
-            # meeting columns: id, event_id, creator_id, creator_username, title, description, start_time, end_time, created_at
-            registration_count = self.get_registration_count(meeting[0])
-            start_time = datetime.fromisoformat(
-                meeting[6])  # start_time is at index 6
+            meeting_id = meeting['id']
+            registration_count = meeting['registration_count']
+            start_time = datetime.fromtimestamp(meeting['start_ts'])
 
             keyboard = [[
                 InlineKeyboardButton("📊 View Stats",
-                                     callback_data=f"stats_{meeting[0]}"),
+                                     callback_data=f"stats_{meeting_id}"),
                 InlineKeyboardButton("🗑️ Delete",
-                                     callback_data=f"delete_{meeting[0]}")
+                                     callback_data=f"delete_{meeting_id}")
             ]]
             reply_markup = InlineKeyboardMarkup(keyboard)
 
             meeting_text = (
-                f"🌸 **{meeting[4]}**\n"  # title is at index 4
-                f"📝 {meeting[5]}\n"  # description is at index 5
+                f"🌸 **{meeting['title']}**\n"
+                f"📝 {meeting['description']}\n"
                 f"🕐 {start_time.strftime('%Y-%m-%d at %H:%M')}\n"
                 f"👥 Registered: {registration_count} members\n")
 
-            # Add calendar link if available (calendar_link is at index 8)
-            if len(meeting) > 8 and meeting[8]:
-                meeting_text += f"📞 [Join Meeting]({meeting[8]})\n"
+            # Add calendar link if available
+            if meeting['calendar_link']:
+                meeting_text += f"📞 [Join Meeting]({meeting['calendar_link']})\n"
 
-            meeting_text += f"🆔 Meeting ID: {meeting[0]}"
+            meeting_text += f"🆔 Meeting ID: {meeting_id}"
 
             await update.message.reply_text(meeting_text,
                                             reply_markup=reply_markup,
@@ -472,289 +838,453 @@ class GirlTalkBot:
         user_id = update.effective_user.id
         username = update.effective_user.username or "Unknown"
 
-        logger.info(f"User {user_id} (@{username}) clicked button: {data}")
-        logger.debug(f"Processing callback query: {data}")
+        logger.info("User %s (@%s) clicked button: %s",
+                    user_id, username, data)
+        logger.debug("Processing callback query: %s", data)
 
         if data.startswith("register_"):
             meeting_id = int(data.split("_")[1])
-            logger.debug(
-                f"User {user_id} attempting to register for meeting {meeting_id}"
-            )
-            success = self.register_user_for_meeting(meeting_id, user_id,
-                                                     username)
+            logger.debug("User %s attempting to register for meeting %s",
+                         user_id, meeting_id)
+            success = await self.register_user_for_meeting(
+                meeting_id, user_id, username)
 
             if success:
-                logger.info(
-                    f"User {user_id} successfully registered for meeting {meeting_id}"
-                )
-                registration_count = self.get_registration_count(meeting_id)
+                logger.info("User %s successfully registered for meeting %s",
+                            user_id, meeting_id)
+                registration_count = await self.run_db(
+                    self.get_registration_count, meeting_id)
+                # Only replace this meeting's row; the message may list several
+                registered_row = [
+                    InlineKeyboardButton(
+                        REGISTERED_BUTTON_TEXT.format(
+                            meeting_id=meeting_id, count=registration_count),
+                        callback_data=f"registered_{meeting_id}"),
+                    InlineKeyboardButton(
+                        STATS_BUTTON_TEXT.format(meeting_id=meeting_id),
+                        callback_data=f"stats_{meeting_id}")
+                ]
+                keyboard = [
+                    registered_row if any(button.callback_data == data
+                                          for button in row) else row
+                    for row in query.message.reply_markup.inline_keyboard
+                ]
                 await query.edit_message_reply_markup(
-                    reply_markup=InlineKeyboardMarkup([[
-                        InlineKeyboardButton(
-                            f"✅ Registered ({registration_count} registered)",
-                            callback_data=f"registered_{meeting_id}"),
-                        InlineKeyboardButton(
-                            "📊 Stats", callback_data=f"stats_{meeting_id}")
-                    ]]))
+                    reply_markup=InlineKeyboardMarkup(keyboard))
                 await query.message.reply_text(
                     f"🎉 You're registered for the meeting! ✨\n"
                     f"Total registered: {registration_count} members")
             else:
-                logger.debug(
-                    f"User {user_id} already registered for meeting {meeting_id}"
-                )
+                logger.debug("User %s already registered for meeting %s",
+                             user_id, meeting_id)
                 await query.message.reply_text(
                     "ℹ️ You're already registered for this meeting!")
 
         elif data.startswith("stats_"):
             meeting_id = int(data.split("_")[1])
-            logger.debug(
-                f"User {user_id} requested stats for meeting {meeting_id}")
+            logger.debug("User %s requested stats for meeting %s",
+                         user_id, meeting_id)
             await self.show_meeting_stats(query.message, meeting_id)
 
         elif data.startswith("delete_"):
             meeting_id = int(data.split("_")[1])
-            logger.debug(
-                f"User {user_id} attempting to delete meeting {meeting_id}")
-            meeting = self.get_meeting_by_id(meeting_id)
-
-            # meeting columns: id, event_id, creator_id, creator_username, title, description, start_time, end_time, created_at
-            if meeting and meeting[2] == user_id:  # creator_id is at index 2
-                logger.debug(
-                    f"User {user_id} authorized to delete meeting {meeting_id}"
-                )
-                success = await self.delete_meeting(meeting_id, meeting[2])
+            logger.debug("User %s attempting to delete meeting %s",
+                         user_id, meeting_id)
+            meeting = await self.run_db(self.get_meeting_by_id, meeting_id)
+
+            if meeting and meeting['creator_id'] == user_id:
+                logger.debug("User %s authorized to delete meeting %s",
+                             user_id, meeting_id)
+                success = await self.delete_meeting(meeting_id,
+                                                    meeting['creator_id'])
                 if success:
-                    logger.info(
-                        f"User {user_id} successfully deleted meeting {meeting_id}"
-                    )
+                    logger.info("User %s successfully deleted meeting %s",
+                                user_id, meeting_id)
                     await query.edit_message_text(
                         "🗑️ Meeting deleted successfully!")
                 else:
-                    logger.error(
-                        f"Failed to delete meeting {meeting_id} for user {user_id}"
-                    )
+                    logger.error("Failed to delete meeting %s for user %s",
+                                 meeting_id, user_id)
                     await query.message.reply_text(
                         "❌ Error deleting meeting. Please try again.")
             else:
-                logger.warning(
-                    f"User {user_id} unauthorized to delete meeting {meeting_id}"
-                )
+                logger.warning("User %s unauthorized to delete meeting %s",
+                               user_id, meeting_id)
                 await query.message.reply_text(
                     "❌ You can only delete meetings you created.")
 
     async def show_meeting_stats(self, message, meeting_id: int):
         """Show detailed statistics for a meeting"""
-        meeting = self.get_meeting_by_id(meeting_id)
+        meeting = await self.run_db(self.get_meeting_by_id, meeting_id)
         if not meeting:
             await message.reply_text("❌ Meeting not found.")
             return
 
-        registrations = self.get_meeting_registrations(meeting_id)
+        registrations = await self.run_db(
+            self.get_meeting_registrations, meeting_id)
         registration_count = len(registrations)
 
-        # meeting columns: id, event_id, creator_id, creator_username, title, description, start_time, end_time, created_at
-        start_time = datetime.fromisoformat(
-            meeting[6])  # start_time is at index 6
+        start_time = datetime.fromtimestamp(meeting['start_ts'])
 
-        stats_text = (
+        # Collect the pieces and join once; repeated += is quadratic for
+        # meetings with many registrants
+        parts = [
             f"📊 Meeting Statistics 📊\n\n"
-            f"🌸 {meeting[4]}\n"  # title is at index 4
-            f"📝 {meeting[5]}\n"  # description is at index 5
+            f"🌸 {meeting['title']}\n"
+            f"📝 {meeting['description']}\n"
             f"🕐 {start_time.strftime('%Y-%m-%d at %H:%M')}\n"
-            f"👩‍💼 Created by: @{meeting[3] or 'Unknown'}\n"  # creator_username is at index 3
-        )
+            f"👩‍💼 Created by: @{meeting['creator_username'] or 'Unknown'}\n"
+        ]
 
-        # Add calendar link if available (calendar_link is at index 8)
-        if len(meeting) > 8 and meeting[8]:
-            stats_text += f"📞 Join Meeting: {meeting[8]}\n"
+        # Add calendar link if available
+        if meeting['calendar_link']:
+            parts.append(f"📞 Join Meeting: {meeting['calendar_link']}\n")
 
-        stats_text += (f"\n👥 Registration Stats:\n"
-                       f"• Total registered: {registration_count} members\n\n")
+        parts.append(f"\n👥 Registration Stats:\n"
+                     f"• Total registered: {registration_count} members\n\n")
 
         if registrations:
-            stats_text += "📋 Registered Members:\n"
-            for reg in registrations:
-                reg_time = datetime.fromisoformat(reg[4])
-                username = reg[3] or 'Unknown'
-                stats_text += f"• @{username} (registered {reg_time.strftime('%m-%d %H:%M')})\n"
+            parts.append("📋 Registered Members:\n")
+            parts.extend(
+                f"• @{reg['username'] or 'Unknown'} (registered "
+                f"{datetime.fromtimestamp(reg['registered_ts']).strftime('%m-%d %H:%M')})\n"
+                for reg in registrations)
 
-        await message.reply_text(stats_text, disable_web_page_preview=True)
+        await message.reply_text("".join(parts),
+                                 disable_web_page_preview=True)
 
     def get_upcoming_meetings(self) -> List:
-        """Get all upcoming meetings from database"""
+        """Get all upcoming meetings with their registration counts"""
         logger.debug("Fetching upcoming meetings from database")
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
+        now = int(time.time())
+        logger.debug("Querying meetings after: %s", now)
 
-        now = datetime.now().isoformat()
-        logger.debug(f"Querying meetings after: {now}")
-        cursor.execute(
-            '''
-            SELECT * FROM meetings 
-            WHERE start_time > ? 
-            ORDER BY start_time ASC
-        ''', (now, ))
-
-        meetings = cursor.fetchall()
-        conn.close()
-        logger.debug(f"Found {len(meetings)} upcoming meetings")
+        with self._read() as cursor:
+            cursor.execute(SQL_UPCOMING_MEETINGS, (now, ))
+            meetings = cursor.fetchall()
+
+        logger.debug("Found %s upcoming meetings", len(meetings))
         return meetings
 
     def get_user_meetings(self, user_id: int) -> List:
-        """Get meetings created by a specific user"""
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            '''
-            SELECT * FROM meetings 
-            WHERE creator_id = ? 
-            ORDER BY start_time ASC
-        ''', (user_id, ))
-
-        meetings = cursor.fetchall()
-        conn.close()
-        return meetings
+        """Get meetings created by a specific user with registration counts"""
+        with self._read() as cursor:
+            cursor.execute(SQL_USER_MEETINGS, (user_id, ))
+            return cursor.fetchall()
 
     def get_meeting_by_id(self, meeting_id: int):
         """Get meeting details by ID"""
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-
-        cursor.execute('SELECT * FROM meetings WHERE id = ?', (meeting_id, ))
-        meeting = cursor.fetchone()
-        conn.close()
-        return meeting
+        with self._read() as cursor:
+            cursor.execute(SQL_MEETING_BY_ID, (meeting_id, ))
+            return cursor.fetchone()
 
     def get_registration_count(self, meeting_id: int) -> int:
         """Get number of registrations for a meeting"""
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            'SELECT COUNT(*) FROM registrations WHERE meeting_id = ?',
-            (meeting_id, ))
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
+        with self._read() as cursor:
+            cursor.execute(SQL_REGISTRATION_COUNT, (meeting_id, ))
+            return cursor.fetchone()[0]
 
     def get_meeting_registrations(self, meeting_id: int) -> List:
         """Get all registrations for a meeting"""
-        conn = sqlite3.connect(DATABASE_FILE)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            '''
-            SELECT * FROM registrations 
-            WHERE meeting_id = ? 
-            ORDER BY registered_at ASC
-        ''', (meeting_id, ))
-
-        registrations = cursor.fetchall()
-        conn.close()
-        return registrations
-
-    def register_user_for_meeting(self, meeting_id: int, user_id: int,
-                                  username: str) -> bool:
-        """Register a user for a meeting"""
-        logger.debug(
-            f"Attempting to register user {user_id} (@{username}) for meeting {meeting_id}"
-        )
-        try:
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-
+        with self._read() as cursor:
+            cursor.execute(SQL_MEETING_REGISTRATIONS, (meeting_id, ))
+            return cursor.fetchall()
+
+    def save_meeting(self, event_id: str, creator_id: int,
+                     creator_username: str, title: str, description: str,
+                     start_time: datetime, end_time: datetime,
+                     calendar_link: Optional[str]):
+        """Store a newly created meeting in the database"""
+        with self._write() as cursor:
             cursor.execute(
-                '''
-                INSERT INTO registrations (meeting_id, user_id, username)
-                VALUES (?, ?, ?)
-            ''', (meeting_id, user_id, username))
-
-            conn.commit()
-            conn.close()
-            logger.info(f"User {user_id} registered for meeting {meeting_id}")
-            return True
+                SQL_INSERT_MEETING,
+                (event_id, creator_id, creator_username, title, description,
+                 start_time.isoformat(), end_time.isoformat(), calendar_link,
+                 int(start_time.timestamp()), int(end_time.timestamp())))
+
+    async def register_user_for_meeting(self, meeting_id: int, user_id: int,
+                                        username: str) -> bool:
+        """Register a user for a meeting via the batched registration writer"""
+        logger.debug("Attempting to register user %s (@%s) for meeting %s",
+                     user_id, username, meeting_id)
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((future, meeting_id, user_id, username))
+        return await future
+
+    async def registration_writer(self):
+        """Drain queued registrations and commit each burst in one transaction"""
+        while True:
+            batch = [await self._write_queue.get()]
+            try:
+                while True:
+                    batch.append(self._write_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                pass
 
-        except sqlite3.IntegrityError as e:
-            # User already registered
-            logger.debug(
-                f"User {user_id} already registered for meeting {meeting_id}: {e}"
-            )
-            return False
-        except Exception as e:
-            logger.error(
-                f"Error registering user {user_id} for meeting {meeting_id}: {e}"
-            )
-            return False
+            rows = [(meeting_id, user_id, username)
+                    for _, meeting_id, user_id, username in batch]
+            try:
+                results = await self.run_db(self.save_registrations, rows)
+            except Exception as e:
+                logger.error("Error saving batch of %s registrations: %s",
+                             len(rows), e)
+                results = [False] * len(rows)
+
+            for (future, *_), success in zip(batch, results):
+                if not future.done():
+                    future.set_result(success)
+
+    def save_registrations(self, registrations: List[tuple]) -> List[bool]:
+        """Insert (meeting_id, user_id, username) rows in a single transaction
+
+        Returns one flag per row: False when the user was already registered.
+        """
+        results = []
+        with self._write() as cursor:
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                for meeting_id, user_id, username in registrations:
+                    # UNIQUE(meeting_id, user_id) turns a repeat registration
+                    # into a no-op instead of an IntegrityError
+                    cursor.execute(SQL_INSERT_REGISTRATION,
+                                   (meeting_id, user_id, username))
+                    if cursor.rowcount == 1:
+                        logger.info("User %s registered for meeting %s",
+                                    user_id, meeting_id)
+                        results.append(True)
+                    else:
+                        logger.debug("User %s already registered for meeting %s",
+                                     user_id, meeting_id)
+                        results.append(False)
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+        return results
 
     async def delete_meeting(self, meeting_id: int, creator_id: int) -> bool:
         """Delete a meeting and its registrations"""
         try:
-            meeting = self.get_meeting_by_id(meeting_id)
-            # meeting columns: id, event_id, creator_id, creator_username, title, description, start_time, end_time, created_at
-            if not meeting or meeting[
-                    2] != creator_id:  # creator_id is at index 2
+            meeting = await self.run_db(self.get_meeting_by_id, meeting_id)
+            if not meeting or meeting['creator_id'] != creator_id:
                 return False
 
-            event_id = meeting[1]  # event_id is at index 1
+            event_id = meeting['event_id']
+            pending_event_id = None
 
             # Delete from Google Calendar if enabled and event exists there
             if GOOGLE_CALENDAR_ON and self.calendar_service and not event_id.startswith(
                     'local_event_'):
-                try:
-                    self.calendar_service.events().delete(
-                        calendarId=CALENDAR_ID, eventId=event_id).execute()
-                    logger.info(f"Google Calendar event deleted: {event_id}")
-                except HttpError as e:
+                # Only a short bounded retry happens here so the user isn't
+                # kept waiting; a delete that still fails is recorded in
+                # pending_calendar_ops together with the row deletion and
+                # retried with backoff by calendar_reconciler
+                deleted = await self.delete_calendar_event(event_id)
+                if deleted is False:
+                    logger.warning(
+                        "Queued Google Calendar event %s for deletion retry",
+                        event_id)
+                    pending_event_id = event_id
+                elif deleted is None:
                     logger.error(
-                        f"Google Calendar API error during deletion: {e}")
-                    # Continue with database deletion even if Google Calendar fails
-                except Exception as e:
-                    logger.error(f"Error deleting Google Calendar event: {e}")
-                    # Continue with database deletion even if Google Calendar fails
+                        "Google Calendar event %s must be deleted manually",
+                        event_id)
             else:
                 if not GOOGLE_CALENDAR_ON:
                     logger.info(
-                        f"Meeting deleted (Google Calendar disabled): {event_id}"
-                    )
+                        "Meeting deleted (Google Calendar disabled): %s",
+                        event_id)
                 else:
-                    logger.info(f"Local meeting deleted: {event_id}")
+                    logger.info("Local meeting deleted: %s", event_id)
 
             # Delete from database
-            conn = sqlite3.connect(DATABASE_FILE)
-            cursor = conn.cursor()
-
-            # Delete registrations first
-            cursor.execute('DELETE FROM registrations WHERE meeting_id = ?',
-                           (meeting_id, ))
-
-            # Delete meeting
-            cursor.execute('DELETE FROM meetings WHERE id = ?', (meeting_id, ))
-
-            conn.commit()
-            conn.close()
+            await self.run_db(self.delete_meeting_rows, meeting_id,
+                              pending_event_id)
 
-            logger.info(f"Meeting {meeting_id} deleted successfully")
+            logger.info("Meeting %s deleted successfully", meeting_id)
             return True
 
         except Exception as e:
-            logger.error(f"Error deleting meeting: {e}")
+            logger.error("Error deleting meeting: %s", e)
             return False
 
+    async def delete_calendar_event(
+            self, event_id: str,
+            attempts: int = CALENDAR_RETRY_ATTEMPTS) -> Optional[bool]:
+        """Delete a Google Calendar event, retrying transient API errors
+
+        Returns True once the event is gone from the calendar, False when a
+        later retry may still succeed and None when the API rejected the
+        request outright (e.g. 400 or 403), so retrying is pointless.
+        """
+        for attempt in range(attempts):
+            try:
+                await self.run_calendar_request(
+                    self._calendar_events.delete(
+                        calendarId=CALENDAR_ID, eventId=event_id))
+                logger.info("Google Calendar event deleted: %s", event_id)
+                return True
+            except HttpError as e:
+                status = e.resp.status
+                if status in (404, 410):
+                    logger.info("Google Calendar event already deleted: %s",
+                                event_id)
+                    return True
+                if status not in CALENDAR_RETRY_STATUSES:
+                    logger.error(
+                        "Google Calendar API error during deletion: %s", e)
+                    return None
+                if attempt == attempts - 1:
+                    logger.error(
+                        "Google Calendar API error during deletion: %s", e)
+                    return False
+                delay = retry_delay(e.resp.get('retry-after'), attempt)
+                logger.warning(
+                    "Google Calendar returned %s deleting %s, retrying in %.1fs",
+                    status, event_id, delay)
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error("Error deleting Google Calendar event: %s", e)
+                return False
+        return False
+
+    def delete_meeting_rows(self, meeting_id: int,
+                            pending_event_id: Optional[str] = None):
+        """Delete a meeting and its registrations in one transaction
+
+        When pending_event_id is given, its calendar deletion is queued in
+        pending_calendar_ops within the same transaction.
+        """
+        with self._write() as cursor:
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                # Delete registrations first
+                cursor.execute(SQL_DELETE_MEETING_REGISTRATIONS, (meeting_id, ))
+
+                # Delete meeting
+                cursor.execute(SQL_DELETE_MEETING, (meeting_id, ))
+
+                if pending_event_id:
+                    cursor.execute(SQL_INSERT_PENDING_CALENDAR_DELETE,
+                                   (pending_event_id,
+                                    int(time.time()) + RECONCILE_INTERVAL))
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+
+    async def calendar_reconciler(self):
+        """Retry queued Google Calendar deletions until they succeed or fail"""
+        while True:
+            try:
+                operations = await self.run_db(self.get_due_calendar_deletes)
+            except Exception as e:
+                logger.error("Error loading pending Calendar operations: %s", e)
+                operations = []
+
+            # Each operation is handled on its own, so one failing row
+            # cannot starve the rest of the batch
+            for operation in operations:
+                try:
+                    await self.retry_calendar_delete(operation)
+                except Exception as e:
+                    logger.error("Error retrying Calendar operation %s: %s",
+                                 operation['id'], e)
+
+            await asyncio.sleep(RECONCILE_INTERVAL)
+
+    async def retry_calendar_delete(self, operation: sqlite3.Row):
+        """Make one more attempt at a queued calendar deletion"""
+        event_id = operation['event_id']
+        deleted = await self.delete_calendar_event(event_id, attempts=1)
+        attempts = operation['attempts'] + 1
+        if deleted:
+            await self.run_db(self.finish_calendar_op, operation['id'])
+        elif deleted is None or attempts >= RECONCILE_MAX_ATTEMPTS:
+            # Permanent error or out of retries: drop the operation so it
+            # doesn't come back every sweep
+            logger.error(
+                "Giving up deleting Google Calendar event %s after %s "
+                "attempts; it must be deleted manually", event_id, attempts)
+            await self.run_db(self.finish_calendar_op, operation['id'])
+        else:
+            delay = retry_delay(None, attempts, max_delay=RECONCILE_MAX_DELAY)
+            logger.warning(
+                "Google Calendar deletion of %s failed (attempt %s), "
+                "retrying in %.0fs", event_id, attempts, delay)
+            await self.run_db(self.reschedule_calendar_op, operation['id'],
+                              attempts, int(time.time() + delay))
+
+    def get_due_calendar_deletes(self) -> List:
+        """Get queued calendar deletions whose next attempt is due"""
+        with self._read() as cursor:
+            cursor.execute(SQL_DUE_CALENDAR_DELETES,
+                           (int(time.time()), RECONCILE_BATCH_SIZE))
+            return cursor.fetchall()
+
+    def finish_calendar_op(self, op_id: int):
+        """Remove a pending calendar operation that is done or abandoned"""
+        with self._write() as cursor:
+            cursor.execute(SQL_DELETE_CALENDAR_OP, (op_id, ))
+
+    def reschedule_calendar_op(self, op_id: int, attempts: int,
+                               next_try_ts: int):
+        """Record a failed attempt and when to try the operation again"""
+        with self._write() as cursor:
+            cursor.execute(SQL_RESCHEDULE_CALENDAR_OP,
+                           (attempts, next_try_ts, op_id))
+
     async def handle_keyboard_buttons(self, update: Update,
                                       context: ContextTypes.DEFAULT_TYPE):
         """Handle keyboard button presses"""
-        text = update.message.text
-
-        if text == "📅 Create Meeting":
-            await self.create_meeting_command(update, context)
-        elif text == "📋 Upcoming Meetings":
-            await self.upcoming_meetings_command(update, context)
-        elif text == "📊 My Meetings":
-            await self.my_meetings_command(update, context)
-        elif text == "❓ Help":
-            await self.help_command(update, context)
+        method_name = KEYBOARD_COMMANDS.get(update.message.text)
+        if method_name:
+            await getattr(self, method_name)(update, context)
+
+    async def post_init(self, application: Application):
+        """Prepare the event loop once the application is initialized"""
+        # Blocking SQLite calls run on this pool via run_db so the loop
+        # keeps serving Telegram updates
+        self._db_executor = ThreadPoolExecutor(
+            max_workers=DB_MAX_WORKERS, thread_name_prefix='sqlite')
+        self._calendar_executor = ThreadPoolExecutor(
+            max_workers=CALENDAR_MAX_WORKERS, thread_name_prefix='calendar')
+
+        # Publish the command menu so clients can offer it without asking
+        try:
+            await application.bot.set_my_commands([
+                BotCommand(command, description)
+                for command, description, _ in BOT_COMMANDS
+            ])
+        except Exception as e:
+            logger.error("Error setting bot commands: %s", e)
+
+        # Registrations are funnelled through a single writer task
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self.registration_writer())
+
+        # Calendar deletions that failed earlier are retried in the background
+        if GOOGLE_CALENDAR_ON and self.calendar_service:
+            self._reconciler_task = asyncio.create_task(
+                self.calendar_reconciler())
+
+    async def post_stop(self, application: Application):
+        """Stop background tasks once the application has stopped"""
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._reconciler_task:
+            self._reconciler_task.cancel()
+            self._reconciler_task = None
+        if self._db_executor:
+            # Let SQLite work already running finish and drop anything still
+            # queued, so close() finalizes the database with no job in flight
+            await asyncio.to_thread(self._db_executor.shutdown,
+                                    wait=True, cancel_futures=True)
+            self._db_executor = None
+        if self._calendar_executor:
+            self._calendar_executor.shutdown(wait=False)
+            self._calendar_executor = None
 
     def run(self):
         """Start the bot"""
@@ -763,63 +1293,134 @@ class GirlTalkBot:
             logger.error("TELEGRAM_BOT_TOKEN environment variable not set")
             return
 
-        logger.debug(f"Bot token loaded: {self.bot_token[:10]}...")
+        logger.debug("Bot token loaded: %s...", self.bot_token[:10])
 
         # Create application
         logger.debug("Creating Telegram application")
-        application = Application.builder().token(self.bot_token).build()
+        # Outgoing requests get a large connection pool of their own; the
+        # single long-running getUpdates call uses a separate one. Outgoing
+        # calls are also throttled to stay within Telegram's flood limits.
+        # Handlers are non-blocking by default, so one waiting on SQLite or
+        # Google Calendar does not hold up the next update.
+        application = (
+            Application.builder()
+            .token(self.bot_token)
+            .connection_pool_size(CONNECTION_POOL_SIZE)
+            .pool_timeout(30.0)
+            .connect_timeout(10.0)
+            .read_timeout(30.0)
+            .get_updates_connection_pool_size(1)
+            .get_updates_pool_timeout(40.0)
+            .rate_limiter(
+                AIORateLimiter(overall_max_rate=RATE_LIMIT_PER_SECOND,
+                               overall_time_period=1,
+                               max_retries=RATE_LIMIT_RETRIES))
+            .defaults(HANDLER_DEFAULTS)
+            .post_init(self.post_init)
+            .post_stop(self.post_stop)
+            .build())
 
         # Add handlers
         logger.debug("Adding command handlers")
-        application.add_handler(CommandHandler("start", self.start_command))
-        application.add_handler(CommandHandler("help", self.help_command))
-        application.add_handler(
-            CommandHandler("create_meeting", self.create_meeting_command))
-        application.add_handler(
-            CommandHandler("upcoming_meetings",
-                           self.upcoming_meetings_command))
-        application.add_handler(
-            CommandHandler("my_meetings", self.my_meetings_command))
+        create_meeting_entry = None
+        for command, _, method_name in BOT_COMMANDS:
+            handler = CommandHandler(command, getattr(self, method_name))
+            if method_name == 'create_meeting_command':
+                # Entry point of the creation conversation added below
+                create_meeting_entry = handler
+            else:
+                application.add_handler(handler)
 
         # Handle callback queries (inline buttons)
         logger.debug("Adding callback query handler")
         application.add_handler(
             CallbackQueryHandler(self.handle_callback_query))
 
-        # Handle keyboard buttons
+        # Handle keyboard buttons (Create Meeting is the conversation's entry)
         logger.debug("Adding keyboard button handler")
         application.add_handler(
-            MessageHandler(
-                filters.Regex(
-                    "^(📅 Create Meeting|📋 Upcoming Meetings|📊 My Meetings|❓ Help)$"
-                ), self.handle_keyboard_buttons))
-
-        # Handle meeting creation flow
-        logger.debug("Adding meeting creation handler")
+            MessageHandler(filters.Regex(KEYBOARD_PATTERN),
+                           self.handle_keyboard_buttons))
+
+        # Handle meeting creation flow; PTB routes each message straight to
+        # the handler for the user's current step. Only new text messages
+        # count as input, so edits, channel posts and keyboard buttons
+        # (handled above) never reach the flow.
+        logger.debug("Adding meeting creation conversation handler")
+        meeting_input = (filters.UpdateType.MESSAGE & filters.TEXT
+                         & ~filters.COMMAND & ~filters.Regex(KEYBOARD_PATTERN))
         application.add_handler(
-            MessageHandler(filters.TEXT & ~filters.COMMAND,
-                           self.handle_meeting_creation))
+            ConversationHandler(
+                entry_points=[
+                    create_meeting_entry,
+                    MessageHandler(
+                        filters.Regex(CREATE_MEETING_PATTERN),
+                        self.create_meeting_command)
+                ],
+                states={
+                    MEETING_TITLE: [
+                        MessageHandler(meeting_input,
+                                       self.receive_meeting_title)
+                    ],
+                    MEETING_DESCRIPTION: [
+                        MessageHandler(meeting_input,
+                                       self.receive_meeting_description)
+                    ],
+                    MEETING_DATETIME: [
+                        MessageHandler(meeting_input,
+                                       self.receive_meeting_datetime)
+                    ],
+                    # Steps run non-blocking like every other handler, so the
+                    # final step's Calendar insert doesn't stall other users.
+                    # Messages the user sends while a step is still running
+                    # land here instead of being dropped silently.
+                    ConversationHandler.WAITING: [
+                        MessageHandler(
+                            filters.UpdateType.MESSAGE & filters.TEXT
+                            & ~filters.Regex(KEYBOARD_PATTERN),
+                            self.meeting_creation_in_progress)
+                    ],
+                },
+                fallbacks=[],
+                allow_reentry=True))
 
         # Start the bot
         logger.info("Starting GirlTalkBot...")
-        logger.debug("Starting polling for updates")
-        application.run_polling()
+        if WEBHOOK_URL:
+            logger.debug("Starting webhook listener on port %s", WEBHOOK_PORT)
+            application.run_webhook(
+                listen='0.0.0.0',
+                port=WEBHOOK_PORT,
+                url_path=self.bot_token,
+                webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{self.bot_token}",
+                allowed_updates=ALLOWED_UPDATES,
+                max_connections=WEBHOOK_MAX_CONNECTIONS)
+        else:
+            logger.debug("Starting polling for updates")
+            application.run_polling(poll_interval=0.0,
+                                    timeout=POLL_TIMEOUT,
+                                    allowed_updates=ALLOWED_UPDATES,
+                                    drop_pending_updates=False)
 
 
 def main():
     """Main function to run the bot"""
     logger.info("🌸 Starting GirlTalkBot application 🌸")
-    logger.debug(f"Google Calendar feature toggle: {GOOGLE_CALENDAR_ON}")
-    logger.debug(f"Database file: {DATABASE_FILE}")
+    logger.debug("Google Calendar feature toggle: %s", GOOGLE_CALENDAR_ON)
+    logger.debug("Database file: %s", DATABASE_FILE)
 
+    bot = None
     try:
         bot = GirlTalkBot()
         bot.run()
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
-        logger.error(f"Fatal error starting bot: {e}")
+        logger.error("Fatal error starting bot: %s", e)
         raise
+    finally:
+        if bot:
+            bot.close()
 
 
 if __name__ == '__main__':
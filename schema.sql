@@ -13,7 +13,9 @@ CREATE TABLE IF NOT EXISTS meetings (
     start_time TEXT,
     end_time TEXT,
     calendar_link TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    start_ts INTEGER,  -- start_time as Unix epoch seconds
+    end_ts INTEGER  -- end_time as Unix epoch seconds
 );
 
 -- Registrations table to store user registrations for meetings
@@ -23,27 +25,47 @@ CREATE TABLE IF NOT EXISTS registrations (
     user_id INTEGER,
     username TEXT,
     registered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    registered_ts INTEGER,  -- registered_at as Unix epoch seconds
     FOREIGN KEY (meeting_id) REFERENCES meetings (id),
     UNIQUE(meeting_id, user_id)
 );
 
+-- Google Calendar operations that failed and are retried in the background
+CREATE TABLE IF NOT EXISTS pending_calendar_ops (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL,
+    op TEXT NOT NULL,  -- currently only 'delete'
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_try_ts INTEGER NOT NULL,  -- Unix epoch seconds of the next attempt
+    UNIQUE(event_id, op)
+);
+
 -- Indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_meetings_start_time ON meetings(start_time);
+CREATE INDEX IF NOT EXISTS idx_meetings_start_ts ON meetings(start_ts);
 CREATE INDEX IF NOT EXISTS idx_meetings_creator_id ON meetings(creator_id);
 CREATE INDEX IF NOT EXISTS idx_registrations_meeting_id ON registrations(meeting_id);
 CREATE INDEX IF NOT EXISTS idx_registrations_user_id ON registrations(user_id);
+CREATE INDEX IF NOT EXISTS idx_pending_calendar_ops_next_try_ts ON pending_calendar_ops(next_try_ts);
 
 -- Test data insertion
 -- Insert sample meetings (only if no data exists)
-INSERT OR IGNORE INTO meetings (id, event_id, creator_id, creator_username, title, description, start_time, end_time, calendar_link, created_at) VALUES
+-- Epoch columns are derived from the local-time start/end strings
+INSERT OR IGNORE INTO meetings (id, event_id, creator_id, creator_username, title, description, start_time, end_time, calendar_link, created_at, start_ts, end_ts)
+SELECT column1, column2, column3, column4, column5, column6, column7, column8, column9, column10,
+       CAST(strftime('%s', column7, 'utc') AS INTEGER),
+       CAST(strftime('%s', column8, 'utc') AS INTEGER)
+FROM (VALUES
 (1, 'test_event_1', 123456789, 'alice_community', 'Welcome Coffee Chat', 'Join us for a casual coffee chat to welcome new members to the Girl Talk Community!', '2025-08-20 14:00:00', '2025-08-20 15:00:00', 'https://calendar.google.com/event?test=1', '2025-08-16 10:00:00'),
 (2, 'test_event_2', 987654321, 'sarah_leader', 'Monthly Book Club Discussion', 'This month we are discussing "Becoming" by Michelle Obama. Come prepared with your thoughts!', '2025-08-25 18:30:00', '2025-08-25 20:00:00', 'https://calendar.google.com/event?test=2', '2025-08-16 11:00:00'),
 (3, 'test_event_3', 456789123, 'emma_organizer', 'Career Development Workshop', 'Interactive workshop on resume building and interview preparation for professional growth.', '2025-08-30 16:00:00', '2025-08-30 17:30:00', 'https://calendar.google.com/event?test=3', '2025-08-16 12:00:00'),
 (4, 'test_event_4', 789123456, 'maria_host', 'Wellness Wednesday Yoga', 'Relaxing yoga session to destress and connect with fellow community members.', '2025-09-05 19:00:00', '2025-09-05 20:00:00', 'https://calendar.google.com/event?test=4', '2025-08-16 13:00:00'),
-(5, 'test_event_5', 321654987, 'jennifer_mentor', 'Entrepreneurship Panel', 'Panel discussion with successful female entrepreneurs sharing their journey and tips.', '2025-09-10 17:00:00', '2025-09-10 18:30:00', 'https://calendar.google.com/event?test=5', '2025-08-16 14:00:00');
+(5, 'test_event_5', 321654987, 'jennifer_mentor', 'Entrepreneurship Panel', 'Panel discussion with successful female entrepreneurs sharing their journey and tips.', '2025-09-10 17:00:00', '2025-09-10 18:30:00', 'https://calendar.google.com/event?test=5', '2025-08-16 14:00:00'));
 
 -- Insert sample registrations for the meetings
-INSERT OR IGNORE INTO registrations (meeting_id, user_id, username, registered_at) VALUES
+-- registered_at is UTC, like CURRENT_TIMESTAMP
+INSERT OR IGNORE INTO registrations (meeting_id, user_id, username, registered_at, registered_ts)
+SELECT column1, column2, column3, column4, CAST(strftime('%s', column4) AS INTEGER)
+FROM (VALUES
 -- Coffee Chat registrations
 (1, 111222333, 'jessica_newbie', '2025-08-16 15:00:00'),
 (1, 444555666, 'lisa_student', '2025-08-16 16:30:00'),
@@ -68,4 +90,4 @@ INSERT OR IGNORE INTO registrations (meeting_id, user_id, username, registered_a
 (5, 777888999, 'anna_professional', '2025-08-20 09:15:00'),
 (5, 999111222, 'michelle_jobseeker', '2025-08-20 14:30:00'),
 (5, 333444555, 'diana_startup', '2025-08-20 16:45:00'),
-(5, 666777888, 'caroline_founder', '2025-08-20 19:20:00');
+(5, 666777888, 'caroline_founder', '2025-08-20 19:20:00'));